@@ -22,58 +22,240 @@ Usage:
 
   # Mark content hash as seen
   python3 feed_scanner.py --mark "hash_string"
+
+  # Stream large content from stdin instead of the command line
+  cat article.txt | python3 feed_scanner.py --seen -
 """
 
-import argparse
 import hashlib
 import json
+import mmap
 import os
 import sys
 from datetime import datetime, timezone
 
+# Dedup keys don't need a cryptographic hash; prefer the fast SIMD
+# hashes when available and fall back to stdlib sha256. Each backend
+# provides the one-shot digest plus an incremental hasher for streams.
+try:
+    from blake3 import blake3 as _blake3
+
+    def _digest16(data):
+        return _blake3(data).digest(length=16)
+
+    _hasher = _blake3
+
+    def _finish16(h):
+        return h.digest(length=16)
+except ImportError:
+    try:
+        import xxhash
+
+        def _digest16(data):
+            return xxhash.xxh3_128_digest(data)
+
+        _hasher = xxhash.xxh3_128
+
+        def _finish16(h):
+            return h.digest()
+    except ImportError:
+        def _digest16(data):
+            return hashlib.sha256(data).digest()[:16]
+
+        _hasher = hashlib.sha256
+
+        def _finish16(h):
+            return h.digest()[:16]
+
+# State files are machine-read; use orjson when available and skip
+# pretty-printing. Human-facing echoes keep stdlib json with indent.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
 STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "state")
 MONITORS_FILE = os.path.join(STATE_DIR, "monitors.json")
-SEEN_FILE = os.path.join(STATE_DIR, "seen_hashes.json")
+SEEN_FILE = os.path.join(STATE_DIR, "seen_hashes.bin")
+BLOOM_FILE = os.path.join(STATE_DIR, "seen.bloom")
 MAX_SEEN = 500
+# 64 Kbit filter for MAX_SEEN entries gives ~13 bits/element (~1e-6 FPR)
+BLOOM_BITS = 65536
+BLOOM_HASHES = 13
+# Steady-state density at MAX_SEEN entries is ~0.09; past this the
+# filter is carrying evicted keys and gets rebuilt from the ring
+BLOOM_MAX_DENSITY = 0.2
+# Ring buffer layout: 4-byte head index + MAX_SEEN slots of 8-byte keys
+RING_HDR = 4
+RING_SLOT = 8
 
 
 def ensure_state_dir():
     os.makedirs(STATE_DIR, exist_ok=True)
 
 
+class BloomSeen:
+    """Persistent Bloom filter used as a prefilter over the seen ring.
+
+    Membership checks are O(1) bit probes instead of a list scan; a
+    negative answer is definitive, a positive one is confirmed against
+    the ring, which rotates and stays authoritative. Indices are double
+    hashed (h1 + i*h2 mod M) from the 8-byte ring key so the filter can
+    be rebuilt from the ring alone once it accumulates evicted keys.
+    """
+
+    def __init__(self, path=BLOOM_FILE, bits=BLOOM_BITS, hashes=BLOOM_HASHES):
+        self.path = path
+        self.bits = bits
+        self.hashes = hashes
+        self._buf = None
+
+    def _load(self):
+        if self._buf is None:
+            ensure_state_dir()
+            nbytes = self.bits // 8
+            if not os.path.exists(self.path) or os.path.getsize(self.path) != nbytes:
+                with open(self.path, "wb") as f:
+                    f.write(bytes(nbytes))
+            fd = os.open(self.path, os.O_RDWR)
+            try:
+                self._buf = mmap.mmap(fd, nbytes)
+            finally:
+                os.close(fd)
+        return self._buf
+
+    def _indices(self, key):
+        u = int.from_bytes(key[:8], "big")
+        h1 = u >> 32
+        h2 = (u & 0xFFFFFFFF) | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def contains(self, key):
+        buf = self._load()
+        return all(buf[i >> 3] & (1 << (i & 7)) for i in self._indices(key))
+
+    def add(self, key):
+        # No explicit msync/fsync: dirty pages of the shared mapping are
+        # written back by the OS, which is durable enough for a dedup cache.
+        buf = self._load()
+        for i in self._indices(key):
+            buf[i >> 3] |= 1 << (i & 7)
+
+    def clear(self):
+        buf = self._load()
+        buf[:] = bytes(self.bits // 8)
+
+    def density(self):
+        buf = self._load()
+        return bin(int.from_bytes(bytes(buf[:]), "big")).count("1") / self.bits
+
+
+_BLOOM = BloomSeen()
+_RING = None
+
+
+def _ring():
+    global _RING
+    if _RING is None:
+        _RING = open_seen_ring()
+    return _RING
+
+
 def load_monitors():
     ensure_state_dir()
     if os.path.exists(MONITORS_FILE):
-        with open(MONITORS_FILE, "r") as f:
-            return json.load(f)
+        with open(MONITORS_FILE, "rb") as f:
+            return _loads(f.read())
     return {"monitors": []}
 
 
 def save_monitors(data):
     ensure_state_dir()
-    with open(MONITORS_FILE, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(MONITORS_FILE, "wb") as f:
+        f.write(_dumps(data))
 
 
-def load_seen():
+def open_seen_ring():
     ensure_state_dir()
-    if os.path.exists(SEEN_FILE):
-        with open(SEEN_FILE, "r") as f:
-            return json.load(f)
-    return {"hashes": []}
-
-
-def save_seen(data):
-    ensure_state_dir()
-    # Rotate if over limit
-    if len(data["hashes"]) > MAX_SEEN:
-        data["hashes"] = data["hashes"][-MAX_SEEN:]
-    with open(SEEN_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    size = RING_HDR + MAX_SEEN * RING_SLOT
+    if not os.path.exists(SEEN_FILE) or os.path.getsize(SEEN_FILE) != size:
+        with open(SEEN_FILE, "wb") as f:
+            f.write(bytes(size))
+    fd = os.open(SEEN_FILE, os.O_RDWR)
+    try:
+        return mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+
+
+def ring_contains(ring, key):
+    # Slot-aligned scan; empty slots are all-zero and never match a digest
+    buf = bytes(ring[RING_HDR:])
+    pos = buf.find(key)
+    while pos != -1 and pos % RING_SLOT:
+        pos = buf.find(key, pos + 1)
+    return pos != -1
+
+
+def ring_add(ring, key):
+    head = int.from_bytes(ring[:RING_HDR], "little")
+    off = RING_HDR + head * RING_SLOT
+    ring[off:off + RING_SLOT] = key
+    ring[:RING_HDR] = ((head + 1) % MAX_SEEN).to_bytes(RING_HDR, "little")
+
+
+STREAM_CHUNK = 1 << 20
+
+
+def content_digest(text):
+    # Strip after encoding so the one-shot and streamed paths share the
+    # same (ASCII) whitespace definition and produce identical keys
+    return _digest16(text.encode("utf-8").strip())
+
+
+def content_digest_stream(src):
+    # Hash a binary file-like object in 1 MiB chunks so multi-MB
+    # articles are never materialized whole. Leading/trailing ASCII
+    # whitespace is stripped across chunk boundaries, matching
+    # content_digest's byte-level strip.
+    h = _hasher()
+    tail_ws = b""
+    lead = True
+    while True:
+        chunk = src.read(STREAM_CHUNK)
+        if not chunk:
+            break
+        if lead:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            lead = False
+        body = chunk.rstrip()
+        if body:
+            if tail_ws:
+                h.update(tail_ws)
+            h.update(body)
+            tail_ws = chunk[len(body):]
+        else:
+            tail_ws += chunk
+    return _finish16(h)
+
+
+def content_hash_stream(src):
+    if hasattr(src, "read"):
+        return content_digest_stream(src)[:RING_SLOT]
+    return content_hash(src)
 
 
 def content_hash(text):
-    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()[:16]
+    # Raw 8-byte dedup key; use .hex() for the printable form
+    return content_digest(text)[:RING_SLOT]
 
 
 def list_monitors():
@@ -142,10 +324,25 @@ def remove_monitor(monitor_id):
         print(f"Monitor {monitor_id} not found")
 
 
-def check_seen(text):
-    h = content_hash(text)
-    seen = load_seen()
-    if h in seen["hashes"]:
+def _rebuild_bloom(ring):
+    # The ring is authoritative; reset the filter to just the live keys
+    # so evicted content stops hitting the prefilter.
+    _BLOOM.clear()
+    slots = bytes(ring[RING_HDR:])
+    empty = bytes(RING_SLOT)
+    for off in range(0, len(slots), RING_SLOT):
+        key = slots[off:off + RING_SLOT]
+        if key != empty:
+            _BLOOM.add(key)
+
+
+def _check_digest(d):
+    h = d.hex()[:16]
+    key = d[:RING_SLOT]
+    # Bloom miss is definitive; a hit still has to be confirmed against
+    # the ring so rotated-out content is re-analysed, matching the old
+    # last-MAX_SEEN semantics.
+    if _BLOOM.contains(key) and ring_contains(_ring(), key):
         print(f"SEEN:{h}")
         return True
     else:
@@ -153,16 +350,46 @@ def check_seen(text):
         return False
 
 
-def mark_seen(text):
-    h = content_hash(text)
-    seen = load_seen()
-    if h not in seen["hashes"]:
-        seen["hashes"].append(h)
-        save_seen(seen)
+def _mark_digest(d):
+    h = d.hex()[:16]
+    key = d[:RING_SLOT]
+    ring = _ring()
+    if not ring_contains(ring, key):
+        ring_add(ring, key)
+        _BLOOM.add(key)
+        if _BLOOM.density() > BLOOM_MAX_DENSITY:
+            _rebuild_bloom(ring)
     print(f"MARKED:{h}")
 
 
+def check_seen(text):
+    return _check_digest(content_digest(text))
+
+
+def mark_seen(text):
+    _mark_digest(content_digest(text))
+
+
+def _cli_digest(arg):
+    # "-" streams the article from stdin instead of passing it on the
+    # command line (and avoids holding it in memory at all).
+    if arg == "-":
+        return content_digest_stream(sys.stdin.buffer)
+    return content_digest(arg)
+
+
 if __name__ == "__main__":
+    # Fast path for the per-article verbs: the monitor calls --seen and
+    # --mark in a loop, so skip argparse (import + parser construction)
+    # entirely when the command line is one of the two known shapes.
+    if len(sys.argv) == 3 and sys.argv[1] == "--seen":
+        sys.exit(0 if _check_digest(_cli_digest(sys.argv[2])) else 1)
+    if len(sys.argv) == 3 and sys.argv[1] == "--mark":
+        _mark_digest(_cli_digest(sys.argv[2]))
+        sys.exit(0)
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Pressure Framework Feed Scanner")
     parser.add_argument("--list", action="store_true")
     parser.add_argument("--add", action="store_true")
@@ -38,6 +38,13 @@ import json
 import sys
 from datetime import datetime, timezone
 
+# NumPy turns the per-axis threshold scan into one SIMD comparison;
+# the pure-Python traversal below remains the fallback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 MODELS = {
     "soram": {
         "name": "SORAM", "axes": {
@@ -84,36 +91,131 @@ TRAPN_LABELS = {
     "P": "POLARISATION ACTIVE", "N": "NORMALISATION UNDERWAY"
 }
 
+HR = "━" * 28
+SEP = "─" * 28
+_TS_FMT = "%Y-%m-%d %H:%M UTC"
+
+# Render-ready rows: model names and axis labels pre-padded so the
+# report loop does no dict lookups, slicing, or %-padding per line.
+_MODEL_ROWS = tuple(
+    (mk, mdef["name"].ljust(8), tuple((ak, al[:10].ljust(10)) for ak, al in mdef["axes"].items()))
+    for mk, mdef in MODELS.items())
+
+
+# Severity markers and bars indexed by quantized value — a report renders
+# dozens of these, so each call is a single table deref instead of
+# chained comparisons and string multiplication.
+_SEV_EMOJI = tuple("🔴" if v >= 8 else "🟠" if v >= 6 else "🟡" if v >= 4 else "🟢" for v in range(11))
+_SEV_ASCII = tuple("[!!!]" if v >= 8 else "[!! ]" if v >= 6 else "[!  ]" if v >= 4 else "[   ]" for v in range(11))
+_BARS = {w: tuple("█" * f + "░" * (w - f) for f in range(w + 1)) for w in (8, 10, 20)}
+
 
 def severity(val, emoji=True):
-    if emoji:
-        return "🔴" if val >= 8 else "🟠" if val >= 6 else "🟡" if val >= 4 else "🟢"
-    return "[!!!]" if val >= 8 else "[!! ]" if val >= 6 else "[!  ]" if val >= 4 else "[   ]"
+    return _SEV_EMOJI[int(val)] if emoji else _SEV_ASCII[int(val)]
 
 
 def bar(val, width=10):
-    filled = round((val / 10) * width)
-    return "█" * filled + "░" * (width - filled)
+    cells = _BARS.get(width)
+    if cells is None:
+        filled = round((val / 10) * width)
+        return "█" * filled + "░" * (width - filled)
+    return cells[round((val / 10) * width)]
+
+
+DEFAULT_THRESHOLDS = {"overall_pressure": 6.0, "ppi_score": 6.0,
+                      "any_single_axis": 8, "model_average": 7.0}
 
 
-def model_avg(scores):
-    vals = [v for v in scores.values() if v is not None]
-    return round(sum(vals) / len(vals), 2) if vals else 0
+# One-entry "last used" cache: the CLI paths pass the same parsed dict
+# through format/check/alert, so identity comparison is enough to skip
+# recomputing.
+_last = [None, None, None]
 
 
-def compute(data):
+def compute(data, thresholds=None):
+    if thresholds is None:
+        thresholds = DEFAULT_THRESHOLDS
+    if _last[0] is data and _last[1] is thresholds:
+        return _last[2]
+    result = _compute_impl(data, thresholds)
+    _last[0] = data
+    _last[1] = thresholds
+    _last[2] = result
+    return result
+
+
+def _compute_impl(data, thresholds):
+    # One traversal of scores produces per-model averages, the dominant
+    # TRAP-N phase, and the per-axis/per-model threshold alerts that
+    # check_thresholds previously re-walked the data for.
     scores = data.get("scores", {})
-    averages = {k: model_avg(scores.get(k, {})) for k in MODELS}
+    thr_axis = thresholds["any_single_axis"]
+    thr_model = thresholds["model_average"]
+
+    averages = {}
+    model_alerts = []
+    trapn_top = (None, 0)
+
+    if np is not None:
+        # One int8 vector over the scores as the input dicts order them
+        # (-1 marks None), so unknown axis keys still count and the
+        # TRAP-N argmax breaks ties on the first max in input order —
+        # identical results to the Python path below.
+        flat = []
+        spans = []
+        for mk, mdef in MODELS.items():
+            lo = len(flat)
+            for ak, v in scores.get(mk, {}).items():
+                flat.append((ak, -1 if v is None else v))
+            spans.append((mk, mdef, lo, len(flat)))
+        arr = np.fromiter((t[1] for t in flat), dtype=np.int8, count=len(flat))
+        for mk, mdef, lo, hi in spans:
+            seg = arr[lo:hi]
+            valid = seg >= 0
+            count = int(valid.sum())
+            avg = round(int(seg[valid].sum()) / count, 2) if count else 0
+            averages[mk] = avg
+            for j in np.flatnonzero(seg >= thr_axis):
+                i = lo + int(j)
+                v = int(arr[i])
+                ak = flat[i][0]
+                model_alerts.append({"type": "axis", "level": "critical" if v >= 9 else "warning",
+                                     "message": f"{mdef['name']}.{ak} ({mdef['axes'].get(ak, ak)}) at {v}/10"})
+            if avg >= thr_model:
+                model_alerts.append({"type": "model", "level": "critical" if avg >= 8.5 else "warning",
+                                     "message": f"{mdef['name']} average at {avg}/10"})
+            if mk == "trapn" and count:
+                jmax = int(seg.argmax())
+                vmax = int(seg[jmax])
+                if vmax > 0:
+                    trapn_top = (flat[lo + jmax][0], vmax)
+    else:
+        for mk, mdef in MODELS.items():
+            ms = scores.get(mk, {})
+            total = count = 0
+            is_trapn = mk == "trapn"
+            for ak, v in ms.items():
+                if v is None:
+                    continue
+                total += v
+                count += 1
+                if is_trapn and v > trapn_top[1]:
+                    trapn_top = (ak, v)
+                if v >= thr_axis:
+                    model_alerts.append({"type": "axis", "level": "critical" if v >= 9 else "warning",
+                                         "message": f"{mdef['name']}.{ak} ({mdef['axes'].get(ak, ak)}) at {v}/10"})
+            avg = round(total / count, 2) if count else 0
+            averages[mk] = avg
+            if avg >= thr_model:
+                model_alerts.append({"type": "model", "level": "critical" if avg >= 8.5 else "warning",
+                                     "message": f"{mdef['name']} average at {avg}/10"})
+
     ppi = averages.get("narcs", 0)
     overall = round(sum(averages.get(k, 0) * w for k, w in WEIGHTS.items()), 2)
 
-    # Dominant TRAP-N
-    trapn_scores = scores.get("trapn", {})
     dominant = None
-    if trapn_scores:
-        top = max(trapn_scores.items(), key=lambda x: x[1] if x[1] else 0)
-        if top[1] and top[1] > 0:
-            dominant = f"{top[0]} — {TRAPN_LABELS.get(top[0], '?')}"
+    if trapn_top[1] > 0:
+        dominant = f"{trapn_top[0]} — {TRAPN_LABELS.get(trapn_top[0], '?')}"
 
     if overall >= 7:
         verdict = "HIGH PRESSURE — conditions ripe for influence operation"
@@ -127,106 +229,148 @@ def compute(data):
 
     return {
         "averages": averages, "ppi": ppi, "overall": overall,
-        "dominant_trapn": dominant, "verdict": verdict, "level": level
+        "dominant_trapn": dominant, "verdict": verdict, "level": level,
+        "model_alerts": model_alerts
     }
 
 
-def format_report(data, use_emoji=True):
+# The emoji/plain choice is fixed for a whole report, so each variant's
+# prefixes and severity table are frozen in a module-level table and the
+# renderer below never branches on the flag.
+_P_EMOJI = {
+    "sev": _SEV_EMOJI,
+    "title": "⚡ PRESSURE ANALYSIS REPORT",
+    "pin": "📌 ", "clk": "🕐 ", "chart": "📊 ", "loc": "📍 ",
+    "brain": "🧠 ", "lens": "🔍 ", "scroll": "📜 ",
+    "di_solving": "⚙️", "di_adapting": "⚡",
+}
+_P_PLAIN = {
+    "sev": _SEV_ASCII,
+    "title": "   PRESSURE ANALYSIS REPORT",
+    "pin": "Event: ", "clk": "Time:  ", "chart": "", "loc": "",
+    "brain": "", "lens": "", "scroll": "",
+    "di_solving": "", "di_adapting": "",
+}
+
+
+def _format_report_emoji(data, now=None):
+    return _render_report(data, _P_EMOJI, now)
+
+
+def _format_report_plain(data, now=None):
+    return _render_report(data, _P_PLAIN, now)
+
+
+def format_report(data, use_emoji=True, now=None):
+    return (_format_report_emoji if use_emoji else _format_report_plain)(data, now)
+
+
+def _render_report(data, p, now):
     scores = data.get("scores", {})
     comp = compute(data)
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    s = severity  # shorthand
-    e = use_emoji
+    if now is None:
+        now = datetime.now(timezone.utc)
+    ts = now.strftime(_TS_FMT)
+
+    sev = p["sev"]
+    title = p["title"]
+    pin = p["pin"]
+    clk = p["clk"]
+    chart = p["chart"]
+    loc = p["loc"]
+    brain = p["brain"]
+    lens = p["lens"]
+    scroll = p["scroll"]
+    di_solving = p["di_solving"]
+    di_adapting = p["di_adapting"]
 
     lines = []
-    lines.append("━" * 28)
-    lines.append("⚡ PRESSURE ANALYSIS REPORT" if e else "   PRESSURE ANALYSIS REPORT")
-    lines.append("━" * 28)
-    lines.append(f"{'📌 ' if e else 'Event: '}{data.get('event', 'Unknown')}")
-    lines.append(f"{'🕐 ' if e else 'Time:  '}{ts}")
-    lines.append("")
-
-    level_i = s(comp["overall"], e)
-    lines.append(f"{level_i} OVERALL: {comp['overall']}/10")
-    lines.append(f"   {bar(comp['overall'], 20)}")
-    lines.append(f"   {comp['verdict']}")
-    lines.append("")
-
-    lines.append(f"{'📊 ' if e else ''}PHASE SCORES")
-    lines.append("─" * 28)
-    for mk, mdef in MODELS.items():
+    app = lines.append
+    app(HR)
+    app(title)
+    app(HR)
+    app(f"{pin}{data.get('event', 'Unknown')}")
+    app(f"{clk}{ts}")
+    app("")
+
+    app(f"{sev[int(comp['overall'])]} OVERALL: {comp['overall']}/10")
+    app(f"   {bar(comp['overall'], 20)}")
+    app(f"   {comp['verdict']}")
+    app("")
+
+    app(f"{chart}PHASE SCORES")
+    app(SEP)
+    for mk, name8, axes in _MODEL_ROWS:
         avg = comp["averages"][mk]
-        mi = s(avg, e)
-        lines.append(f"{mi} {mdef['name']:8s} {avg:4.1f}/10  {bar(avg)}")
+        app(f"{sev[int(avg)]} {name8} {avg:4.1f}/10  {bar(avg)}")
         ms = scores.get(mk, {})
-        for ak, al in mdef["axes"].items():
+        for ak, label10 in axes:
             v = ms.get(ak)
             if v is not None:
-                ai = s(v, e)
-                lines.append(f"   {ai} {ak}·{al[:10]:10s} {v:2d}/10 {bar(v, 8)}")
-        lines.append("")
+                app(f"   {sev[v]} {ak}·{label10} {v:2d}/10 {bar(v, 8)}")
+        app("")
 
     # PPI
-    pi = s(comp["ppi"], e)
-    lines.append("━" * 28)
-    lines.append(f"{pi} PPI (Psyop Probability Index): {comp['ppi']}/10")
+    app(HR)
+    app(f"{sev[int(comp['ppi'])]} PPI (Psyop Probability Index): {comp['ppi']}/10")
     if comp["ppi"] >= 7:
-        lines.append("   Conditions ripe. Intention highly likely.")
+        app("   Conditions ripe. Intention highly likely.")
     elif comp["ppi"] >= 4:
-        lines.append("   Developing. Could be organic or manufactured.")
+        app("   Developing. Could be organic or manufactured.")
     else:
-        lines.append("   Low probability of coordinated influence.")
-    lines.append("")
+        app("   Low probability of coordinated influence.")
+    app("")
 
     if comp["dominant_trapn"]:
-        lines.append(f"{'📍 ' if e else ''}CURRENT PHASE: {comp['dominant_trapn']}")
-        lines.append("")
+        app(f"{loc}CURRENT PHASE: {comp['dominant_trapn']}")
+        app("")
 
     diag = data.get("diagnostic")
     if diag:
-        di = "⚙️" if diag == "solving" and e else "⚡" if e else ""
+        di = di_solving if diag == "solving" else di_adapting
         dt = "Solving a genuine problem" if diag == "solving" else "Teaching adaptation — not solving a real problem"
-        lines.append(f"{di} DIAGNOSTIC: {dt}")
-        lines.append("")
+        app(f"{di} DIAGNOSTIC: {dt}")
+        app("")
 
     # 6-Axis
     sa = scores.get("sixaxis", {})
     if any(v and v > 0 for v in sa.values()):
         dirs = {"focus": "tightens", "openness": "drops", "connection": "erodes",
                 "suggestibility": "rises", "compliance": "increases", "expectancy": "managed"}
-        lines.append(f"{'🧠 ' if e else ''}HUMAN IMPACT (6-Axis)")
-        lines.append("─" * 28)
+        app(f"{brain}HUMAN IMPACT (6-Axis)")
+        app(SEP)
         for ak, v in sa.items():
             if v is not None:
-                ai = s(v, e)
-                lines.append(f"   {ai} {ak:14s} {v:2d}/10 ({dirs.get(ak, '')})")
-        lines.append("")
+                app(f"   {sev[v]} {ak:14s} {v:2d}/10 ({dirs.get(ak, '')})")
+        app("")
 
     obs = data.get("key_observations", [])
     if obs:
-        lines.append(f"{'🔍 ' if e else ''}KEY OBSERVATIONS")
-        lines.append("─" * 28)
+        app(f"{lens}KEY OBSERVATIONS")
+        app(SEP)
         for i, o in enumerate(obs, 1):
-            lines.append(f"   {i}. {o}")
-        lines.append("")
+            app(f"   {i}. {o}")
+        app("")
 
     analog = data.get("historical_analog", "")
     if analog:
-        lines.append(f"{'📜 ' if e else ''}HISTORICAL ANALOG: {analog}")
-        lines.append("")
+        app(f"{scroll}HISTORICAL ANALOG: {analog}")
+        app("")
 
-    lines.append("━" * 28)
-    lines.append("SORAM → PRISM → NARCS/PPI → TRAP-N → FATE → 6-Axis")
-    lines.append("You don't predict events. You predict pressure.")
+    app(HR)
+    app("SORAM → PRISM → NARCS/PPI → TRAP-N → FATE → 6-Axis")
+    app("You don't predict events. You predict pressure.")
 
     return "\n".join(lines)
 
 
-def format_json_export(data):
+def format_json_export(data, now=None):
     comp = compute(data)
+    if now is None:
+        now = datetime.now(timezone.utc)
     export = {
         "event": data.get("event", ""),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": now.isoformat(),
         "scores": data.get("scores", {}),
         "averages": comp["averages"],
         "ppi_score": comp["ppi"],
@@ -262,10 +406,8 @@ def format_alert(data, alerts):
 
 def check_thresholds(data, thresholds=None):
     if thresholds is None:
-        thresholds = {"overall_pressure": 6.0, "ppi_score": 6.0,
-                      "any_single_axis": 8, "model_average": 7.0}
-    comp = compute(data)
-    scores = data.get("scores", {})
+        thresholds = DEFAULT_THRESHOLDS
+    comp = compute(data, thresholds)
     alerts = []
 
     if comp["overall"] >= thresholds["overall_pressure"]:
@@ -274,19 +416,17 @@ def check_thresholds(data, thresholds=None):
     if comp["ppi"] >= thresholds["ppi_score"]:
         alerts.append({"type": "ppi", "level": "critical" if comp["ppi"] >= 8 else "warning",
                        "message": f"PPI at {comp['ppi']}/10"})
-    for mk, mdef in MODELS.items():
-        ms = scores.get(mk, {})
-        for ak, v in ms.items():
-            if v is not None and v >= thresholds["any_single_axis"]:
-                alerts.append({"type": "axis", "level": "critical" if v >= 9 else "warning",
-                               "message": f"{mdef['name']}.{ak} ({mdef['axes'].get(ak, ak)}) at {v}/10"})
-        avg = comp["averages"].get(mk, 0)
-        if avg >= thresholds["model_average"]:
-            alerts.append({"type": "model", "level": "critical" if avg >= 8.5 else "warning",
-                           "message": f"{mdef['name']} average at {avg}/10"})
+    alerts.extend(comp["model_alerts"])
     return alerts
 
 
+def _emit(text):
+    # One utf-8 encode and one buffered write for the whole report —
+    # emoji are 4 bytes each, so re-encoding line by line through print
+    # is measurable on multi-KB output.
+    sys.stdout.buffer.write(text.encode("utf-8") + b"\n")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Pressure Framework Report Formatter")
     parser.add_argument("--json", type=str, help="JSON input data")
@@ -297,18 +437,18 @@ if __name__ == "__main__":
 
     if args.export:
         data = json.loads(args.export)
-        print(format_json_export(data))
+        _emit(format_json_export(data))
     elif args.check:
         data = json.loads(args.check)
         alerts = check_thresholds(data)
         if alerts:
-            print(format_alert(data, alerts))
+            _emit(format_alert(data, alerts))
         else:
             comp = compute(data)
-            print(f"✅ No thresholds triggered. Overall: {comp['overall']}/10 | PPI: {comp['ppi']}/10")
+            _emit(f"✅ No thresholds triggered. Overall: {comp['overall']}/10 | PPI: {comp['ppi']}/10")
     elif args.json:
         data = json.loads(args.json)
-        print(format_report(data, use_emoji=not args.plain))
+        _emit(format_report(data, use_emoji=not args.plain))
     else:
         parser.print_help()
         sys.exit(1)